@@ -24,10 +24,20 @@ Example usage:
 """
 
 import asyncio
+import copy
+import functools
+import inspect
+import itertools
 import json
+import math
 import os
+import sys
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, Union
 from contextlib import asynccontextmanager
 
 try:
@@ -36,8 +46,31 @@ except ImportError:
     print("Please install websockets: pip install websockets")
     raise
 
+try:
+    # websockets >= 13: recv(decode=False) hands back text frames as bytes,
+    # skipping the UTF-8 decode before JSON parsing.
+    from websockets.asyncio.client import connect as _ws_connect
+    _RECV_KWARGS = {"decode": False}
+except ImportError:
+    _ws_connect = websockets.connect
+    _RECV_KWARGS = {}
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        # The bridge only reads text frames, so keep sending str.
+        return orjson.dumps(obj).decode()
 
-@dataclass
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
+
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Configuration for the BioVault agent client."""
     host: str = "127.0.0.1"
@@ -45,6 +78,19 @@ class AgentConfig:
     token: Optional[str] = None
     timeout: float = 30.0
     long_timeout: float = 180.0  # 3 minutes for long-running operations
+    # WebSocket compression ("deflate" or None). Off by default: the bridge is
+    # local and deflating small JSON frames costs more CPU than it saves. The
+    # desktop bridge currently declines permessage-deflate, in which case the
+    # connection silently stays uncompressed.
+    compression: Optional[str] = None
+    # Seconds between WebSocket pings so idle connections stay open (None = off)
+    keepalive_interval: Optional[float] = 20.0
+    # Recycle a shared connection older than this many seconds (None = never)
+    max_lifetime: Optional[float] = None
+    # Read-only batch commands split list/dict args larger than chunk_size
+    # into chunks, sending at most max_concurrency of them at once
+    chunk_size: int = 2000
+    max_concurrency: int = 8
 
     @classmethod
     def from_env(cls) -> "AgentConfig":
@@ -54,6 +100,7 @@ class AgentConfig:
             port=int(os.environ.get("DEV_WS_BRIDGE_PORT", "3333")),
             token=os.environ.get("AGENT_BRIDGE_TOKEN"),
             timeout=float(os.environ.get("BIOVAULT_AGENT_TIMEOUT", "30")),
+            compression=os.environ.get("BIOVAULT_AGENT_COMPRESSION") or None,
         )
 
 
@@ -62,21 +109,62 @@ class BioVaultAgentError(Exception):
     pass
 
 
-@dataclass
 class AgentEvent:
-    """Event emitted during long-running operations."""
-    request_id: int
-    event_type: str  # "progress", "log", "status"
-    data: dict
+    """Event emitted during long-running operations.
+
+    A thin view over the parsed event frame, so no fields are copied out of it.
+    """
+    __slots__ = ("_d",)
+
+    def __init__(self, request_id: int = 0, event_type: str = "unknown", data: Optional[dict] = None):
+        self._d = {"id": request_id, "type": event_type, "data": {} if data is None else data}
+
+    @classmethod
+    def _wrap(cls, frame: dict) -> "AgentEvent":
+        """Wrap a parsed event frame without copying it (receive hot path)."""
+        event = cls.__new__(cls)
+        event._d = frame
+        return event
 
     @classmethod
     def from_dict(cls, data: dict) -> "AgentEvent":
-        return cls(
-            request_id=data.get("id", 0),
-            event_type=data.get("type", "unknown"),
-            data=data.get("data", {}),
+        return cls._wrap(data)
+
+    def __repr__(self) -> str:
+        return f"AgentEvent(request_id={self.request_id!r}, event_type={self.event_type!r}, data={self.data!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.request_id, self.event_type, self.data) == (
+            other.request_id, other.event_type, other.data
         )
 
+    @property
+    def request_id(self) -> int:
+        return self._d.get("id", 0)
+
+    @request_id.setter
+    def request_id(self, value: int):
+        self._d["id"] = value
+
+    @property
+    def event_type(self) -> str:
+        """Event type: "progress", "log", "status"."""
+        return self._d.get("type", "unknown")
+
+    @event_type.setter
+    def event_type(self, value: str):
+        self._d["type"] = value
+
+    @property
+    def data(self) -> dict:
+        return self._d.get("data") or {}
+
+    @data.setter
+    def data(self, value: dict):
+        self._d["data"] = value
+
     @property
     def progress(self) -> Optional[float]:
         """Get progress value (0.0-1.0) if this is a progress event."""
@@ -104,8 +192,218 @@ class AgentEvent:
         return None
 
 
-# Type alias for event callback
-EventCallback = Callable[[AgentEvent], None]
+# Type alias for event callback (plain function or coroutine function)
+EventCallback = Callable[[AgentEvent], Union[None, Awaitable[None]]]
+
+if sys.version_info >= (3, 11):
+    async def _wait_for(future: asyncio.Future, timeout: float) -> Any:
+        # Cheaper than wait_for: no wrapper future or extra task per call
+        async with asyncio.timeout(timeout):
+            return await future
+else:
+    _wait_for = asyncio.wait_for
+
+# Shared args for commands invoked without arguments (never mutated)
+_EMPTY_ARGS: dict = {}
+
+
+def _detached(value: Any) -> Any:
+    """Copy a cached JSON result so a caller mutating it can't change the cache."""
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+def _merge_chunks(results: list) -> Any:
+    """Concatenate list results or merge dict results from chunked calls."""
+    if isinstance(results[0], dict):
+        merged: dict = {}
+        for result in results:
+            merged.update(result)
+        return merged
+    return list(itertools.chain.from_iterable(results))
+
+
+class AgentBatch:
+    """Calls collected by BioVaultAgent.batch(), sent together when the block exits."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, Optional[dict]]] = []
+        self.futures: list[asyncio.Future] = []
+
+    def invoke(self, cmd: str, args: Optional[dict] = None) -> asyncio.Future:
+        """Queue a command; the returned future resolves after the batch is sent."""
+        future = asyncio.get_running_loop().create_future()
+        self.calls.append((cmd, args))
+        self.futures.append(future)
+        return future
+
+
+class AuditSubscription:
+    """
+    Live view of the bridge audit log, returned by BioVaultAgent.subscribe_audit().
+
+    The bridge has no audit push, so the log tail is polled and only entries
+    not seen before are delivered, as "audit.append" events. The newest
+    entries are kept in a local ring buffer that get_audit_log() reads from.
+
+    Polling is not free: every poll is an agent_api_get_audit_log call, which
+    adds a row to the audit log and makes the bridge re-read the whole audit
+    file. The subscription's own poll rows are left out of events and of the
+    buffer. Raise `interval` when following a large log.
+    """
+
+    # Entries fetched per poll; bursts larger than this between polls are truncated
+    POLL_ENTRIES = 100
+
+    def __init__(
+        self,
+        agent: "BioVaultAgent",
+        on_event: Optional[EventCallback],
+        interval: float,
+        buffer_size: int,
+    ):
+        self.entries: deque = deque(maxlen=buffer_size)
+        self._agent = agent
+        self._on_event = on_event
+        self._interval = interval
+        self._last_key: Optional[tuple] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(entry: dict) -> tuple:
+        return (entry.get("timestamp"), entry.get("request_id"), entry.get("cmd"), entry.get("peer_addr"))
+
+    async def _fetch(self, max_entries: int) -> list:
+        return await self._agent.invoke("agent_api_get_audit_log", {"maxEntries": max_entries})
+
+    def _own_peer(self) -> Optional[str]:
+        """This connection's address as the bridge records it in peer_addr."""
+        ws = self._agent._ws
+        local = ws.local_address if ws is not None else None
+        if not local:
+            return None
+        # Same formatting as the bridge's SocketAddr (IPv6 hosts are bracketed)
+        host = f"[{local[0]}]" if ":" in local[0] else local[0]
+        return f"{host}:{local[1]}"
+
+    def _without_own_polls(self, entries: list) -> list:
+        own_peer = self._own_peer()
+        return [
+            entry for entry in entries
+            if not (entry.get("cmd") == "agent_api_get_audit_log" and entry.get("peer_addr") == own_peer)
+        ]
+
+    async def _start(self):
+        tail = await self._fetch(self.entries.maxlen)
+        if tail:
+            self._last_key = self._key(tail[-1])
+        self.entries.extend(self._without_own_polls(tail))
+        self._task = asyncio.create_task(self._poll())
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                tail = await self._fetch(self.POLL_ENTRIES)
+            except BioVaultAgentError:
+                # Timeout or reconnect in progress; try again next tick
+                continue
+            self._append(tail)
+
+    def _append(self, tail: list):
+        new = tail
+        if self._last_key is not None:
+            for i in range(len(tail) - 1, -1, -1):
+                if self._key(tail[i]) == self._last_key:
+                    new = tail[i + 1:]
+                    break
+        if not new:
+            return
+        # Dedupe on the raw tail, which includes our own poll rows
+        self._last_key = self._key(new[-1])
+        # Our own polling shows up in the log; keep it out of the buffer and events
+        new = self._without_own_polls(new)
+        self.entries.extend(new)
+        if self._on_event is None:
+            return
+        for entry in new:
+            self._agent._dispatch_event(
+                self._on_event, AgentEvent(0, "audit.append", entry)
+            )
+
+    def reset(self):
+        """Forget buffered entries (after the log is cleared)."""
+        self.entries.clear()
+        self._last_key = None
+
+    def get(self, max_entries: int = 100) -> list:
+        """Return up to max_entries of the newest buffered entries, oldest first."""
+        skip = max(0, len(self.entries) - max_entries)
+        return list(itertools.islice(self.entries, skip, None))
+
+    @property
+    def active(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def close(self):
+        """Stop polling. There is nothing to unsubscribe on the bridge side."""
+        self._agent._audit_subscriptions.discard(self)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class _PendingRequests:
+    """
+    In-flight response futures indexed by request id.
+
+    Request ids are dense and increasing, so ``id & mask`` picks a slot in a
+    fixed ring (ids and futures kept in parallel lists). An id whose slot is
+    still occupied by an older request goes to an overflow dict instead.
+    """
+    __slots__ = ("_ids", "_futures", "_mask", "_overflow")
+
+    def __init__(self, size: int = 1024):
+        # size must be a power of two; request ids start at 1 so 0 marks a free slot
+        self._ids = [0] * size
+        self._futures: list[Optional[asyncio.Future]] = [None] * size
+        self._mask = size - 1
+        self._overflow: dict[int, asyncio.Future] = {}
+
+    def add(self, request_id: int, future: asyncio.Future):
+        slot = request_id & self._mask
+        if self._ids[slot]:
+            self._overflow[request_id] = future
+        else:
+            self._ids[slot] = request_id
+            self._futures[slot] = future
+
+    def get(self, request_id: Any) -> Optional[asyncio.Future]:
+        if type(request_id) is not int:
+            return None
+        slot = request_id & self._mask
+        if self._ids[slot] == request_id:
+            return self._futures[slot]
+        return self._overflow.get(request_id)
+
+    def pop(self, request_id: int) -> Optional[asyncio.Future]:
+        slot = request_id & self._mask
+        if self._ids[slot] == request_id:
+            future = self._futures[slot]
+            self._ids[slot] = 0
+            self._futures[slot] = None
+            return future
+        return self._overflow.pop(request_id, None)
+
+    def values(self) -> list[asyncio.Future]:
+        futures = [f for f in self._futures if f is not None]
+        futures.extend(self._overflow.values())
+        return futures
 
 
 class BioVaultAgent:
@@ -117,7 +415,7 @@ class BioVaultAgent:
     """
 
     # Commands that need longer timeout
-    LONG_RUNNING_COMMANDS = {
+    LONG_RUNNING_COMMANDS = frozenset(map(sys.intern, {
         "launch_jupyter",
         "stop_jupyter",
         "reset_jupyter",
@@ -134,15 +432,136 @@ class BioVaultAgent:
         "import_pipeline_with_deps",
         "run_pipeline",
         "syftbox_upload_action",
+    }))
+
+    # Read-only commands whose results are cached client-side (TTL in seconds)
+    CACHEABLE_COMMANDS: dict[str, float] = {
+        "get_app_version": math.inf,
+        "is_dev_mode": math.inf,
+        "get_config_path": 60.0,
+        "get_database_path": 60.0,
+        "get_desktop_log_dir": 60.0,
+        "profiles_get_default_home": 60.0,
+        "agent_api_discover": 300.0,
+        "agent_api_events_info": 300.0,
+        "get_default_syftbox_server_url": 300.0,
+        "get_datasets_folder_path": 60.0,
+        "get_runs_base_dir": 60.0,
+        "sql_get_table_schema": 600.0,
     }
 
+    # Mutating commands -> cached commands whose results they make stale;
+    # None drops the whole cache. Audit log reads are never cached.
+    CACHE_INVALIDATED_BY: dict[str, Optional[tuple[str, ...]]] = {
+        "complete_onboarding": None,
+        "profiles_switch_in_place": None,
+        "reset_all_data": None,
+        "reset_everything": None,
+        "save_settings": (
+            "get_config_path",
+            "get_database_path",
+            "get_default_syftbox_server_url",
+            "get_datasets_folder_path",
+            "get_runs_base_dir",
+        ),
+        "sql_run_query": ("sql_get_table_schema",),
+        "import_files_pending": ("sql_get_table_schema",),
+        "delete_dataset": ("get_datasets_folder_path",),
+        "delete_run": ("get_runs_base_dir",),
+    }
+
+    # Upper bound on cached results; the oldest entry is evicted first
+    CACHE_MAX_ENTRIES = 256
+
+    # Max queued requests written per wake-up of the sender task
+    SEND_BATCH_SIZE = 64
+
+    # Seconds check_dependencies results answer check_single_dependency
+    DEP_CACHE_TTL = 10.0
+
+    # Frames at least this large are parsed off the event loop thread
+    LARGE_FRAME_BYTES = 256 * 1024
+
+    # Process-wide agents handed out by shared(), keyed by config
+    _shared: dict[AgentConfig, "BioVaultAgent"] = {}
+
     def __init__(self, config: Optional[AgentConfig] = None):
         self.config = config or AgentConfig.from_env()
         self._ws = None
-        self._request_id = 0
-        self._pending: dict[int, asyncio.Future] = {}
+        self._connected_at = 0.0
+        # Open `async with` blocks; persistent agents stay connected at zero
+        self._refs = 0
+        self._persistent = False
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._connect_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_id = itertools.count(1).__next__
+        # Reused for every request; it is serialized before the next call mutates it
+        self._request: dict[str, Any] = {"id": 0, "cmd": "", "args": _EMPTY_ARGS}
+        self._noarg_templates: dict[str, str] = {}
+        # Token is fixed for the session, so serialize it once and splice it in
+        self._token_fragment = (
+            ',"token":' + _dumps(self.config.token) if self.config.token else ""
+        )
+        self._pending = _PendingRequests()
         self._event_handlers: dict[int, EventCallback] = {}
+        self._event_tasks: set[asyncio.Task] = set()
         self._receiver_task = None
+        # True while disconnect() tears down; any other cancellation of the
+        # receiver means its event loop is shutting down
+        self._disconnecting = False
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._sender_task = None
+        self._parse_executor: Optional[ThreadPoolExecutor] = None
+        # Per-command timeouts; adjust entries at runtime to tune a command.
+        self._cmd_timeout: dict[str, float] = {
+            cmd: self.config.long_timeout for cmd in self.LONG_RUNNING_COMMANDS
+        }
+        self._default_timeout = self.config.timeout
+        self._cache: dict[tuple, tuple[Any, float]] = {}
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._dep_cache: dict[str, dict] = {}
+        self._dep_cache_expiry = 0.0
+        self._audit_subscriptions: set[AuditSubscription] = set()
+
+    @classmethod
+    def shared(cls, config: Optional[AgentConfig] = None) -> "BioVaultAgent":
+        """
+        Get a process-wide agent whose connection outlives `async with` blocks.
+
+        Repeated `async with BioVaultAgent.shared() as agent:` blocks reuse one
+        socket, reconnecting lazily if it dropped, is older than
+        config.max_lifetime, or belongs to a previous event loop.
+        """
+        config = config or AgentConfig.from_env()
+        agent = cls._shared.get(config)
+        if agent is None:
+            agent = cls._shared[config] = cls(config)
+            agent._persistent = True
+        return agent
+
+    @classmethod
+    async def close_shared(cls):
+        """Disconnect and forget all shared agents."""
+        agents = list(cls._shared.values())
+        cls._shared.clear()
+        for agent in agents:
+            await agent.disconnect()
+
+    @staticmethod
+    def install_fast_loop() -> bool:
+        """
+        Use uvloop's event loop policy if uvloop is installed.
+
+        Call before asyncio.run(). Returns True if uvloop was installed.
+        Setting BIOVAULT_USE_UVLOOP=1 does this at import time.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
 
     @property
     def url(self) -> str:
@@ -150,53 +569,240 @@ class BioVaultAgent:
 
     async def connect(self):
         """Connect to the WebSocket bridge."""
-        self._ws = await websockets.connect(self.url)
+        # No frame cap so large responses (e.g. get_run_logs_full) don't drop
+        # the connection.
+        self._loop = asyncio.get_running_loop()
+        self._ws = await _ws_connect(
+            self.url,
+            max_size=None,
+            max_queue=64,
+            compression=self.config.compression,
+            ping_interval=self.config.keepalive_interval,
+            ping_timeout=self.config.keepalive_interval,
+        )
+        self._connected_at = time.monotonic()
         self._receiver_task = asyncio.create_task(self._receive_loop())
+        self._send_queue = asyncio.Queue()
+        self._sender_task = asyncio.create_task(self._send_loop())
+        self._sender_task.add_done_callback(self._sender_done)
+
+    def _sender_done(self, task: asyncio.Task):
+        """Fail in-flight requests if the writer stops other than through disconnect()."""
+        if self._disconnecting or task is not self._sender_task:
+            return
+        exc = None if task.cancelled() else task.exception()
+        error = BioVaultAgentError(f"Sender stopped: {exc!r}" if exc else "Sender stopped")
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        # Nothing queued will be written anymore; drop the connection so the
+        # next ensure_connected() reconnects
+        if self._receiver_task is not None:
+            self._receiver_task.cancel()
 
     async def disconnect(self):
         """Disconnect from the WebSocket bridge."""
-        if self._receiver_task:
-            self._receiver_task.cancel()
-            try:
-                await self._receiver_task
-            except asyncio.CancelledError:
-                pass
+        if self._ws is not None and self._loop is not asyncio.get_running_loop():
+            # Left over from another loop. Its receiver aborts the transport when
+            # that loop cancels it on shutdown; if that never happened, the socket
+            # can't be closed from this loop.
+            transport = getattr(self._ws, "transport", None)
+            if transport is not None and not transport.is_closing():
+                warnings.warn(
+                    "BioVaultAgent: dropping a connection opened on another event loop "
+                    "that was not shut down; its socket could not be closed",
+                    ResourceWarning,
+                    stacklevel=2,
+                )
+            self._ws = None
+            self._sender_task = None
+            self._receiver_task = None
+            return
+        self._disconnecting = True
+        for subscription in list(self._audit_subscriptions):
+            await subscription.close()
+        for task in (self._sender_task, self._receiver_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._sender_task = None
+        self._receiver_task = None
+        if self._parse_executor:
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
         if self._ws:
             await self._ws.close()
             self._ws = None
+        self._disconnecting = False
+
+    async def ensure_connected(self):
+        """Connect unless a usable connection is already open."""
+        loop = asyncio.get_running_loop()
+        if self._connect_lock is None or self._connect_lock_loop is not loop:
+            self._connect_lock = asyncio.Lock()
+            self._connect_lock_loop = loop
+        # Concurrent `async with` blocks must not open two connections
+        async with self._connect_lock:
+            if self._ws is not None:
+                if (
+                    self._loop is not loop
+                    or self._receiver_task.done()
+                    or self._sender_task.done()
+                    or self._expired()
+                ):
+                    await self.disconnect()
+                else:
+                    return
+            await self.connect()
+
+    def _expired(self) -> bool:
+        # Only recycle when no other `async with` block is using the socket
+        return (
+            self.config.max_lifetime is not None
+            and self._refs <= 1
+            and time.monotonic() - self._connected_at > self.config.max_lifetime
+        )
 
     async def __aenter__(self):
-        await self.connect()
+        self._refs += 1
+        try:
+            await self.ensure_connected()
+        except BaseException:
+            self._refs -= 1
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.disconnect()
+        self._refs -= 1
+        if self._refs == 0 and not self._persistent:
+            await self.disconnect()
 
     async def _receive_loop(self):
         """Background task to receive responses and events."""
+        ws = self._ws
+        recv = ws.recv
+        loop = self._loop
         try:
-            async for message in self._ws:
-                data = json.loads(message)
+            while True:
+                message = await recv(**_RECV_KWARGS)
+                if len(message) < self.LARGE_FRAME_BYTES:
+                    data = _loads(message)
+                else:
+                    # Big responses (e.g. get_run_logs_full) would block the loop
+                    # and stall events for other in-flight requests
+                    if self._parse_executor is None:
+                        self._parse_executor = ThreadPoolExecutor(
+                            max_workers=2, thread_name_prefix="biovault-agent-parse"
+                        )
+                    data = await loop.run_in_executor(self._parse_executor, _loads, message)
                 request_id = data.get("id")
 
                 # Check if this is an event (has "type" field) or a response (has "result" or "error")
                 if "type" in data:
-                    # This is a streaming event
-                    if request_id in self._event_handlers:
-                        event = AgentEvent.from_dict(data)
-                        try:
-                            self._event_handlers[request_id](event)
-                        except Exception as e:
-                            # Don't let handler errors crash the receive loop
-                            print(f"Event handler error: {e}")
-                elif request_id in self._pending:
+                    # This is a streaming event; run the handler on a later loop
+                    # iteration so a slow callback doesn't stall receiving
+                    handler = self._event_handlers.get(request_id)
+                    if handler is not None:
+                        loop.call_soon(self._dispatch_event, handler, AgentEvent._wrap(data))
+                else:
                     # This is a final response
-                    self._pending[request_id].set_result(data)
+                    future = self._pending.get(request_id)
+                    if future is not None and not future.done():
+                        future.set_result(data)
         except websockets.ConnectionClosed:
             # Connection closed, cancel all pending requests
             for future in self._pending.values():
                 if not future.done():
                     future.set_exception(BioVaultAgentError("Connection closed"))
+        except asyncio.CancelledError:
+            if not self._disconnecting:
+                # The loop is shutting down (asyncio.run, a test runner) with the
+                # connection still open, e.g. a shared agent. Nothing can close
+                # the socket once this loop is gone, so abort it now.
+                ws.transport.abort()
+            raise
+
+    def _dispatch_event(self, handler: EventCallback, event: AgentEvent):
+        """Run an event callback, scheduling coroutine callbacks as tasks."""
+        try:
+            result = handler(event)
+        except Exception as e:
+            # Don't let handler errors crash the receive loop
+            print(f"Event handler error: {e}")
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._event_tasks.add(task)
+            task.add_done_callback(self._event_task_done)
+
+    def _event_task_done(self, task: asyncio.Task):
+        self._event_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Event handler error: {task.exception()}")
+
+    async def _send_loop(self):
+        """Background task that writes queued requests to the socket."""
+        queue = self._send_queue
+        while True:
+            # Drain everything queued in this loop tick and write it back-to-back
+            batch = [await queue.get()]
+            while len(batch) < self.SEND_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            for payload, future in batch:
+                try:
+                    await self._ws.send(payload)
+                except websockets.ConnectionClosed:
+                    if not future.done():
+                        future.set_exception(BioVaultAgentError("Connection closed"))
+                except Exception as e:
+                    # Fail just this request; the writer keeps serving the rest
+                    if not future.done():
+                        future.set_exception(BioVaultAgentError(f"Send failed: {e}"))
+
+    def _encode_request(self, cmd: str, args: Optional[dict]) -> tuple[int, str]:
+        """Assign a request id and serialize the request frame."""
+        request_id = self._next_id()
+        if not args:
+            # Most commands take no args: only the id varies between frames
+            template = self._noarg_templates.get(cmd) or self._noarg_template(cmd)
+            return request_id, template % request_id
+
+        request = self._request
+        request["id"] = request_id
+        request["cmd"] = cmd
+        request["args"] = args or _EMPTY_ARGS
+
+        payload = _dumps(request)
+        if self._token_fragment:
+            payload = payload[:-1] + self._token_fragment + "}"
+        return request_id, payload
+
+    def _noarg_template(self, cmd: str) -> str:
+        """Build and memoize the %-format frame for a command sent without args."""
+        frame = _dumps({"id": 0, "cmd": cmd, "args": _EMPTY_ARGS})
+        frame = frame[:-1] + self._token_fragment + "}"
+        template = '{"id":%d' + frame[len('{"id":0'):].replace("%", "%%")
+        self._noarg_templates[cmd] = template
+        return template
+
+    def invalidate_cache(self, cmd: Optional[str] = None):
+        """Drop cached results for one command, or all commands if cmd is None."""
+        if cmd is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[0] == cmd]:
+            del self._cache[key]
+
+    def _invalidate_for(self, cmd: str):
+        stale = self.CACHE_INVALIDATED_BY[cmd]
+        if stale is None:
+            self.invalidate_cache()
+            return
+        for cached_cmd in stale:
+            self.invalidate_cache(cached_cmd)
 
     async def invoke(self, cmd: str, args: Optional[dict] = None, timeout: Optional[float] = None) -> Any:
         """
@@ -216,36 +822,66 @@ class BioVaultAgent:
         if not self._ws:
             raise BioVaultAgentError("Not connected")
 
-        self._request_id += 1
-        request_id = self._request_id
-
-        request = {
-            "id": request_id,
-            "cmd": cmd,
-            "args": args or {},
-        }
-
-        if self.config.token:
-            request["token"] = self.config.token
+        ttl = self.CACHEABLE_COMMANDS.get(cmd)
+        if ttl is None:
+            result = await self._invoke(cmd, args, timeout)
+            if cmd in self.CACHE_INVALIDATED_BY:
+                self._invalidate_for(cmd)
+            return result
+
+        cache_key = (cmd, frozenset(args.items()) if args else None)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[1] > time.monotonic():
+            return _detached(cached[0])
+
+        # Concurrent callers of the same read share one in-flight request
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._invoke(cmd, args, timeout))
+            self._inflight[cache_key] = task
+            task.add_done_callback(functools.partial(self._inflight_done, cache_key, ttl))
+        # The task's result is what gets cached, so every caller gets its own copy
+        return _detached(await asyncio.shield(task))
+
+    def _inflight_done(self, cache_key: tuple, ttl: float, task: asyncio.Task):
+        self._inflight.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is None:
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[cache_key] = (task.result(), time.monotonic() + ttl)
+
+    async def _invoke(
+        self,
+        cmd: str,
+        args: Optional[dict],
+        timeout: Optional[float],
+        on_event: Optional[EventCallback] = None,
+    ) -> Any:
+        """Send one request and wait for its response, bypassing the cache."""
+        request_id, payload = self._encode_request(cmd, args)
 
-        # Determine timeout
         if timeout is None:
-            if cmd in self.LONG_RUNNING_COMMANDS:
-                timeout = self.config.long_timeout
-            else:
-                timeout = self.config.timeout
+            timeout = self._cmd_timeout.get(cmd, self._default_timeout)
 
         # Create future for response
-        future = asyncio.get_event_loop().create_future()
-        self._pending[request_id] = future
+        future = self._loop.create_future()
+        self._pending.add(request_id, future)
+
+        # Register event handler if provided
+        if on_event:
+            self._event_handlers[request_id] = on_event
 
         try:
-            await self._ws.send(json.dumps(request))
-            response = await asyncio.wait_for(future, timeout=timeout)
+            if self._sender_task is None or self._sender_task.done():
+                raise BioVaultAgentError("Not connected")
+            self._send_queue.put_nowait((payload, future))
+            response = await _wait_for(future, timeout)
         except asyncio.TimeoutError:
             raise BioVaultAgentError(f"Timeout waiting for response to {cmd}")
         finally:
-            self._pending.pop(request_id, None)
+            self._pending.pop(request_id)
+            if on_event:
+                self._event_handlers.pop(request_id, None)
 
         if "error" in response and response["error"]:
             raise BioVaultAgentError(response["error"])
@@ -265,7 +901,7 @@ class BioVaultAgent:
         Args:
             cmd: Command name
             args: Command arguments
-            on_event: Callback function called for each event
+            on_event: Callback (sync or async) called for each event
             timeout: Override timeout for this request
 
         Returns:
@@ -290,46 +926,117 @@ class BioVaultAgent:
         if not self._ws:
             raise BioVaultAgentError("Not connected")
 
-        self._request_id += 1
-        request_id = self._request_id
+        return await self._invoke(cmd, args, timeout, on_event)
 
-        request = {
-            "id": request_id,
-            "cmd": cmd,
-            "args": args or {},
-        }
+    # -------------------------------------------------------------------------
+    # Concurrent Helpers
+    # -------------------------------------------------------------------------
 
-        if self.config.token:
-            request["token"] = self.config.token
+    async def fetch_all(self, *coros) -> list:
+        """
+        Run independent agent calls concurrently over the one connection.
 
-        # Determine timeout
-        if timeout is None:
-            if cmd in self.LONG_RUNNING_COMMANDS:
-                timeout = self.config.long_timeout
-            else:
-                timeout = self.config.timeout
+        Responses are matched by request id, so overlapping calls cost one
+        round trip instead of one each.
 
-        # Create future for response
-        future = asyncio.get_event_loop().create_future()
-        self._pending[request_id] = future
+        Example:
+            projects, runs = await agent.fetch_all(agent.get_projects(), agent.get_runs())
+        """
+        return list(await asyncio.gather(*coros))
 
-        # Register event handler if provided
-        if on_event:
-            self._event_handlers[request_id] = on_event
+    async def invoke_many(
+        self,
+        calls: list[tuple[str, Optional[dict]]],
+        return_exceptions: bool = False,
+    ) -> list:
+        """
+        Invoke several commands at once and return their results in order.
 
-        try:
-            await self._ws.send(json.dumps(request))
-            response = await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            raise BioVaultAgentError(f"Timeout waiting for response to {cmd}")
-        finally:
-            self._pending.pop(request_id, None)
-            self._event_handlers.pop(request_id, None)
+        All requests are queued in the same loop tick, so the sender writes
+        them back-to-back and they share one round trip.
 
-        if "error" in response and response["error"]:
-            raise BioVaultAgentError(response["error"])
+        Example:
+            tables, files = await agent.invoke_many([
+                ("sql_list_tables", None),
+                ("get_files", None),
+            ])
+        """
+        return list(await asyncio.gather(
+            *(self.invoke(cmd, args) for cmd, args in calls),
+            return_exceptions=return_exceptions,
+        ))
 
-        return response.get("result")
+    @asynccontextmanager
+    async def batch(self):
+        """
+        Collect calls made inside the block and send them together on exit.
+
+        Example:
+            async with agent.batch() as batch:
+                version = batch.invoke("get_app_version")
+                tables = batch.invoke("sql_list_tables")
+            print(version.result(), tables.result())
+        """
+        batch = AgentBatch()
+        try:
+            yield batch
+        except BaseException:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        results = await self.invoke_many(batch.calls, return_exceptions=True)
+        for future, result in zip(batch.futures, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _invoke_chunked(
+        self,
+        cmd: str,
+        key: str,
+        items: Union[list, dict],
+    ) -> Any:
+        """Send a large list/dict argument of a read-only command as concurrent chunks."""
+        size = self.config.chunk_size
+        if len(items) <= size:
+            return await self.invoke(cmd, {key: items})
+        if isinstance(items, dict):
+            pairs = list(items.items())
+            chunks = [dict(pairs[i:i + size]) for i in range(0, len(pairs), size)]
+        else:
+            chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def send(chunk):
+            async with semaphore:
+                return await self.invoke(cmd, {key: chunk})
+
+        return _merge_chunks(await asyncio.gather(*(send(chunk) for chunk in chunks)))
+
+    async def snapshot(self) -> dict:
+        """Fetch the commonly displayed app state in a single round trip."""
+        keys = (
+            "projects",
+            "pipelines",
+            "pipeline_runs",
+            "datasets",
+            "runs",
+            "sessions",
+            "dependencies",
+            "syftbox_state",
+        )
+        results = await self.fetch_all(
+            self.get_projects(),
+            self.get_pipelines(),
+            self.get_pipeline_runs(),
+            self.get_datasets(),
+            self.get_runs(),
+            self.get_sessions(),
+            self.check_dependencies(),
+            self.get_syftbox_state(),
+        )
+        return dict(zip(keys, results))
 
     # -------------------------------------------------------------------------
     # Agent API Discovery
@@ -344,12 +1051,45 @@ class BioVaultAgent:
         return await self.invoke("agent_api_events_info")
 
     async def get_audit_log(self, max_entries: int = 100) -> list:
-        """Get recent audit log entries."""
+        """
+        Get recent audit log entries.
+
+        While an audit subscription is active and its buffer is large enough,
+        this is served from the buffer (at most one poll interval old).
+        """
+        for subscription in self._audit_subscriptions:
+            if subscription.active and max_entries <= subscription.entries.maxlen:
+                return subscription.get(max_entries)
         return await self.invoke("agent_api_get_audit_log", {"maxEntries": max_entries})
 
     async def clear_audit_log(self):
         """Clear the audit log."""
-        return await self.invoke("agent_api_clear_audit_log")
+        result = await self.invoke("agent_api_clear_audit_log")
+        for subscription in self._audit_subscriptions:
+            subscription.reset()
+        return result
+
+    async def subscribe_audit(
+        self,
+        on_event: Optional[EventCallback] = None,
+        interval: float = 1.0,
+        buffer_size: int = 1000,
+    ) -> AuditSubscription:
+        """
+        Follow the audit log, calling on_event for each new entry.
+
+        This polls the bridge every `interval` seconds; see AuditSubscription
+        for what each poll costs on the bridge side.
+
+        Example:
+            sub = await agent.subscribe_audit(lambda e: print(e.data["cmd"]))
+            ...
+            await sub.close()
+        """
+        subscription = AuditSubscription(self, on_event, interval, buffer_size)
+        await subscription._start()
+        self._audit_subscriptions.add(subscription)
+        return subscription
 
     # -------------------------------------------------------------------------
     # App Status
@@ -413,10 +1153,21 @@ class BioVaultAgent:
 
     async def check_dependencies(self) -> list:
         """Check all required dependencies."""
-        return await self.invoke("check_dependencies")
+        result = await self.invoke("check_dependencies")
+        # Remember each entry so check_single_dependency can answer from it
+        deps = result.get("dependencies", []) if isinstance(result, dict) else result
+        self._dep_cache = {
+            dep["name"]: dep for dep in deps or () if isinstance(dep, dict) and "name" in dep
+        }
+        self._dep_cache_expiry = time.monotonic() + self.DEP_CACHE_TTL
+        return result
 
     async def check_single_dependency(self, name: str, path: Optional[str] = None) -> dict:
         """Check a single dependency."""
+        if not path and time.monotonic() < self._dep_cache_expiry:
+            cached = self._dep_cache.get(name)
+            if cached is not None:
+                return _detached(cached)
         args = {"name": name}
         if path:
             args["path"] = path
@@ -428,14 +1179,17 @@ class BioVaultAgent:
 
     async def install_dependencies(self, names: list[str]) -> bool:
         """Install missing dependencies by name."""
+        self._dep_cache = {}
         return await self.invoke("install_dependencies", {"names": names})
 
     async def install_dependency(self, name: str) -> str:
         """Install a single dependency by name."""
+        self._dep_cache = {}
         return await self.invoke("install_dependency", {"name": name})
 
     async def install_brew(self) -> str:
         """Install Homebrew (macOS only)."""
+        self._dep_cache = {}
         return await self.invoke("install_brew")
 
     async def check_brew_installed(self) -> bool:
@@ -876,10 +1630,13 @@ class BioVaultAgent:
 
     async def detect_file_types(self, files: list) -> list:
         """Detect file types for a list of files."""
-        return await self.invoke("detect_file_types", {"files": files})
+        return await self._invoke_chunked("detect_file_types", "files", files)
 
     async def import_files_pending(self, file_metadata: list) -> dict:
         """Import pending files with metadata."""
+        # One call: the bridge serializes imports on its database lock, so
+        # concurrent chunks gain nothing, and a failed chunk would hide which
+        # earlier chunks were already committed
         return await self.invoke("import_files_pending", {"fileMetadata": file_metadata})
 
     async def open_folder(self, path: str):
@@ -967,7 +1724,7 @@ class BioVaultAgent:
 
     async def resolve_syft_urls_batch(self, urls: list) -> dict:
         """Resolve multiple SyftBox URLs to local paths."""
-        return await self.invoke("resolve_syft_urls_batch", {"urls": urls})
+        return await self._invoke_chunked("resolve_syft_urls_batch", "urls", urls)
 
     # -------------------------------------------------------------------------
     # Additional Session Methods
@@ -1042,6 +1799,11 @@ class BioVaultAgent:
         return await self.invoke("delete_thread", {"threadId": thread_id})
 
 
+# Opt-in only: embedders may already manage their own loop policy
+if os.environ.get("BIOVAULT_USE_UVLOOP") == "1":
+    BioVaultAgent.install_fast_loop()
+
+
 # -------------------------------------------------------------------------
 # Example/Demo Code
 # -------------------------------------------------------------------------
@@ -1052,40 +1814,38 @@ async def demo():
     print("=" * 50)
 
     async with BioVaultAgent() as agent:
-        # Discover API
+        # These reads are independent, so issue them together
+        api_info, version, is_onboarded, syftbox_state, projects, audit_log = await asyncio.gather(
+            agent.discover(),
+            agent.get_app_version(),
+            agent.check_is_onboarded(),
+            agent.get_syftbox_state(),
+            agent.get_projects(),
+            agent.get_audit_log(max_entries=5),
+        )
+
         print("\n1. Discovering API...")
-        api_info = await agent.discover()
         print(f"   API Version: {api_info['version']}")
         print(f"   Auth Required: {api_info['auth']['required']}")
 
-        # Get app version
         print("\n2. Getting app version...")
-        version = await agent.get_app_version()
         print(f"   Version: {version}")
 
-        # Check onboarding status
         print("\n3. Checking onboarding status...")
-        is_onboarded = await agent.check_is_onboarded()
         print(f"   Onboarded: {is_onboarded}")
 
-        # Check SyftBox status
         print("\n4. Checking SyftBox status...")
-        syftbox_state = await agent.get_syftbox_state()
         print(f"   Running: {syftbox_state.get('running')}")
         print(f"   Mode: {syftbox_state.get('mode')}")
 
-        # List projects
         print("\n5. Listing projects...")
-        projects = await agent.get_projects()
         if projects:
             for p in projects[:5]:  # Show first 5
                 print(f"   - {p.get('name', 'Unknown')}")
         else:
             print("   No projects found")
 
-        # Get audit log
         print("\n6. Getting recent audit log...")
-        audit_log = await agent.get_audit_log(max_entries=5)
         print(f"   Recent entries: {len(audit_log)}")
 
     print("\n" + "=" * 50)
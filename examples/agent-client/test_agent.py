@@ -13,6 +13,8 @@ Or without pytest:
 """
 
 import asyncio
+import contextvars
+import io
 import os
 import sys
 
@@ -24,14 +26,14 @@ from biovault_agent import BioVaultAgent, BioVaultAgentError, AgentConfig
 
 async def test_connection():
     """Test basic connection to the agent bridge."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         assert agent._ws is not None
         print("  Connection: OK")
 
 
 async def test_discover():
     """Test API discovery endpoint."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         result = await agent.discover()
         assert "version" in result
         assert "name" in result
@@ -41,7 +43,7 @@ async def test_discover():
 
 async def test_get_app_version():
     """Test getting app version."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         version = await agent.get_app_version()
         assert isinstance(version, str)
         assert len(version) > 0
@@ -50,7 +52,7 @@ async def test_get_app_version():
 
 async def test_is_dev_mode():
     """Test dev mode check."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         is_dev = await agent.is_dev_mode()
         assert isinstance(is_dev, bool)
         print(f"  Dev Mode: {is_dev}")
@@ -58,7 +60,7 @@ async def test_is_dev_mode():
 
 async def test_check_is_onboarded():
     """Test onboarding status check."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         is_onboarded = await agent.check_is_onboarded()
         assert isinstance(is_onboarded, bool)
         print(f"  Onboarded: {is_onboarded}")
@@ -66,7 +68,7 @@ async def test_check_is_onboarded():
 
 async def test_get_syftbox_state():
     """Test SyftBox state retrieval."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         state = await agent.get_syftbox_state()
         assert isinstance(state, dict)
         assert "running" in state
@@ -75,7 +77,7 @@ async def test_get_syftbox_state():
 
 async def test_check_dependencies():
     """Test dependency checking."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         deps = await agent.check_dependencies()
         assert isinstance(deps, list)
         print(f"  Dependencies: {len(deps)} found")
@@ -86,7 +88,7 @@ async def test_check_dependencies():
 
 async def test_get_projects():
     """Test project listing."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         projects = await agent.get_projects()
         assert isinstance(projects, list)
         print(f"  Projects: {len(projects)} found")
@@ -94,7 +96,7 @@ async def test_get_projects():
 
 async def test_sql_list_tables():
     """Test SQL table listing."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         tables = await agent.sql_list_tables()
         assert isinstance(tables, list)
         print(f"  Database Tables: {len(tables)}")
@@ -104,7 +106,7 @@ async def test_sql_list_tables():
 
 async def test_audit_log():
     """Test audit log functionality."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         # Get audit log
         log = await agent.get_audit_log(max_entries=5)
         assert isinstance(log, list)
@@ -120,7 +122,7 @@ async def test_audit_log():
 
 async def test_invalid_command():
     """Test that invalid commands return errors."""
-    async with BioVaultAgent() as agent:
+    async with BioVaultAgent.shared() as agent:
         try:
             await agent.invoke("this_command_does_not_exist")
             assert False, "Should have raised an error"
@@ -146,6 +148,24 @@ async def test_auth_with_wrong_token():
             print("  Auth rejection: OK")
 
 
+# Buffer collecting the running test's output; None outside run_all_tests()
+_test_output: contextvars.ContextVar = contextvars.ContextVar("_test_output", default=None)
+
+
+class _PerTestStdout:
+    """Routes print() from a concurrently running test into that test's buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = _test_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
 async def run_all_tests():
     """Run all tests and report results."""
     tests = [
@@ -163,101 +183,118 @@ async def run_all_tests():
         ("Auth Rejection", test_auth_with_wrong_token),
     ]
 
-    passed = 0
-    failed = 0
-    skipped = 0
+    # Tests are independent, so run them concurrently (bounded). Each test's
+    # prints go to its own buffer and are reported in order once all finish.
+    semaphore = asyncio.Semaphore(8)
+
+    async def guarded(test_fn):
+        buffer = io.StringIO()
+        _test_output.set(buffer)
+        async with semaphore:
+            try:
+                await test_fn()
+                result = "PASSED"
+            except AssertionError as e:
+                result = f"FAILED - {e}"
+            except BioVaultAgentError as e:
+                result = f"FAILED - Agent error: {e}"
+            except Exception as e:
+                if "Skipping" in str(e) or "no token" in str(e):
+                    result = "SKIPPED"
+                else:
+                    result = f"ERROR - {type(e).__name__}: {e}"
+        return result, buffer.getvalue()
 
     print("\nBioVault Agent Client Tests")
     print("=" * 50)
 
-    for name, test_fn in tests:
-        print(f"\nTest: {name}")
-        try:
-            await test_fn()
+    stdout = sys.stdout
+    sys.stdout = _PerTestStdout(stdout)
+    try:
+        outcomes = await asyncio.gather(*(guarded(test_fn) for _, test_fn in tests))
+    finally:
+        sys.stdout = stdout
+
+    passed = 0
+    failed = 0
+    skipped = 0
+
+    for (name, _), (result, output) in zip(tests, outcomes):
+        if result == "PASSED":
             passed += 1
-            print(f"  Result: PASSED")
-        except AssertionError as e:
+        elif result == "SKIPPED":
+            skipped += 1
+        else:
             failed += 1
-            print(f"  Result: FAILED - {e}")
-        except BioVaultAgentError as e:
-            failed += 1
-            print(f"  Result: FAILED - Agent error: {e}")
-        except Exception as e:
-            if "Skipping" in str(e) or "no token" in str(e):
-                skipped += 1
-                print(f"  Result: SKIPPED")
-            else:
-                failed += 1
-                print(f"  Result: ERROR - {type(e).__name__}: {e}")
+        print(f"\nTest: {name}")
+        print(output, end="")
+        print(f"  Result: {result}")
 
     print("\n" + "=" * 50)
     print(f"Results: {passed} passed, {failed} failed, {skipped} skipped")
     print("=" * 50)
 
+    await BioVaultAgent.close_shared()
     return failed == 0
 
 
 # Pytest integration
 import pytest
+import pytest_asyncio
+
+# The shared connection lives on one event loop, so every test and the
+# teardown below run on the session loop (pytest-asyncio >= 0.24)
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
-@pytest.fixture
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def shared_agent():
+    """One bridge connection reused by every test in the session."""
+    agent = BioVaultAgent.shared()
+    yield agent
+    await BioVaultAgent.close_shared()
 
 
-@pytest.mark.asyncio
 async def test_connection_pytest():
     await test_connection()
 
 
-@pytest.mark.asyncio
 async def test_discover_pytest():
     await test_discover()
 
 
-@pytest.mark.asyncio
 async def test_get_app_version_pytest():
     await test_get_app_version()
 
 
-@pytest.mark.asyncio
 async def test_is_dev_mode_pytest():
     await test_is_dev_mode()
 
 
-@pytest.mark.asyncio
 async def test_check_is_onboarded_pytest():
     await test_check_is_onboarded()
 
 
-@pytest.mark.asyncio
 async def test_get_syftbox_state_pytest():
     await test_get_syftbox_state()
 
 
-@pytest.mark.asyncio
 async def test_check_dependencies_pytest():
     await test_check_dependencies()
 
 
-@pytest.mark.asyncio
 async def test_get_projects_pytest():
     await test_get_projects()
 
 
-@pytest.mark.asyncio
 async def test_sql_list_tables_pytest():
     await test_sql_list_tables()
 
 
-@pytest.mark.asyncio
 async def test_audit_log_pytest():
     await test_audit_log()
 
 
-@pytest.mark.asyncio
 async def test_invalid_command_pytest():
     await test_invalid_command()
 
@@ -1,8 +1,11 @@
 import os
-from pathlib import Path
 
 input_path = os.environ.get("BV_INPUT_INPUT_TXT", "hello.txt")
 output_path = os.environ.get("BV_OUTPUT_UPPER", "upper.txt")
 
-text = Path(input_path).read_text(encoding="utf-8")
-Path(output_path).write_text(text.upper(), encoding="utf-8")
+# Stream in 4 MiB chunks so memory stays flat regardless of input size
+CHUNK_CHARS = 4 << 20
+
+with open(input_path, encoding="utf-8") as src, open(output_path, "w", encoding="utf-8") as dst:
+    while chunk := src.read(CHUNK_CHARS):
+        dst.write(chunk.upper())
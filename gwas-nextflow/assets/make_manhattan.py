@@ -21,13 +21,40 @@ from matplotlib.ticker import MaxNLocator
 import sys
 import os
 
+# Simplify and chunk long paths so Agg renders dense plots faster
+plt.rcParams['path.simplify'] = True
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Columns used for plotting and the hit tables; other PLINK columns are skipped at parse time
+GWAS_COLUMNS = {'CHR', 'SNP', 'BP', 'A1', 'OR', 'P'}
+
+# Arrow-backed strings keep millions of SNP ids out of per-object Python strings
+try:
+    SNP_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    SNP_DTYPE = object
+
+# QQ plots draw at most this many points: the most significant half in full, the rest evenly thinned
+QQ_MAX_POINTS = 50_000
+
+def _cumulative_positions_numpy(chr_arr, bp_arr):
+    starts = np.flatnonzero(np.r_[True, chr_arr[1:] != chr_arr[:-1]])
+    chr_len = np.maximum.reduceat(bp_arr, starts).astype(np.int64)
+    offsets = np.cumsum(chr_len) - chr_len
+    run_len = np.diff(np.r_[starts, len(bp_arr)])
+    return bp_arr + np.repeat(offsets, run_len), offsets + chr_len / 2
+
+# Offset BP (sorted by CHR, BP) by the preceding chromosomes' max BP; returns (positions, centers).
+cumulative_positions = _cumulative_positions_numpy
+
 def load_gwas_results(filename):
     """Load GWAS results from PLINK output"""
     print(f"Loading GWAS results from {filename}...")
     
-    # Read the file - PLINK output has header
+    # Read the file - PLINK output has header and space-padded columns
     try:
-        df = pd.read_csv(filename, sep='\s+')
+        df = pd.read_csv(filename, sep=r'\s+', engine='c',
+                         usecols=lambda col: col in GWAS_COLUMNS, dtype={'CHR': str, 'SNP': SNP_DTYPE})
         print(f"Initial load: {len(df)} rows")
         print(f"Columns found: {list(df.columns)}")
     except Exception as e:
@@ -40,35 +67,28 @@ def load_gwas_results(filename):
         print(f"Available columns: {list(df.columns)}")
         sys.exit(1)
     
-    # Filter for valid P-values
-    df = df[df['P'].notna()].copy()
-    df = df[df['P'] != 'NA'].copy()
+    # Coerce P/CHR/BP once and keep rows valid in all three with a single mask
+    p = pd.to_numeric(df['P'], errors='coerce')
+    chrom = pd.to_numeric(df['CHR'].replace({'X': 23, 'Y': 24, 'MT': 25, 'M': 25}), errors='coerce')
+    bp = pd.to_numeric(df['BP'], errors='coerce')
+    p_valid = p.notna() & (p > 0) & (p <= 1)
     
-    # Convert P to numeric
-    df['P'] = pd.to_numeric(df['P'], errors='coerce')
-    df = df.dropna(subset=['P'])
-    df = df[(df['P'] > 0) & (df['P'] <= 1)].copy()
+    print(f"After P-value filtering: {int(p_valid.sum())} SNPs")
     
-    print(f"After P-value filtering: {len(df)} SNPs")
-    
-    if len(df) == 0:
+    mask = p_valid & chrom.notna() & bp.notna()
+    if not mask.any():
         print("ERROR: No valid SNPs after filtering!")
         sys.exit(1)
     
-    # Calculate -log10(p)
-    df['NEGLOG10P'] = -np.log10(df['P'])
-    df = df[np.isfinite(df['NEGLOG10P'])].copy()
-    
-    # Convert CHR to numeric
-    df['CHR'] = df['CHR'].replace({'X': 23, 'Y': 24, 'MT': 25, 'M': 25})
-    df['CHR'] = pd.to_numeric(df['CHR'], errors='coerce')
-    df = df.dropna(subset=['CHR'])
-    df['CHR'] = df['CHR'].astype(int)
-    
-    # Convert BP to numeric
-    df['BP'] = pd.to_numeric(df['BP'], errors='coerce')
-    df = df.dropna(subset=['BP'])
-    df['BP'] = df['BP'].astype(int)
+    # Plot-only columns are downcast; P stays float64 for the written hit tables
+    p = p[mask]
+    df = df.loc[mask].assign(
+        P=p,
+        CHR=chrom[mask].astype(np.int8),
+        BP=bp[mask].astype(np.int32),
+        # Calculate -log10(p); P > 0 keeps it finite
+        NEGLOG10P=(-np.log10(p.to_numpy())).astype(np.float32),
+    )
     
     print(f"Final dataset: {len(df):,} SNPs across {df['CHR'].nunique()} chromosomes")
     print(f"P-value range: {df['P'].min():.2e} to {df['P'].max():.2e}")
@@ -76,35 +96,37 @@ def load_gwas_results(filename):
     
     return df
 
-def create_manhattan_plot(df, output_prefix, annotation_pval=1e-5, gw_sig=5e-8):
-    """Create Manhattan plot with annotations"""
+def create_manhattan_plot(df, output_prefix, annotation_pval=1e-5, gw_sig=5e-8, ax=None):
+    """Create Manhattan plot with annotations (on ax if given, else on a new figure)"""
     
     print("Creating Manhattan plot...")
     
     df = df.sort_values(['CHR', 'BP']).reset_index(drop=True)
     
-    # Calculate cumulative position
-    df['cumulative_pos'] = 0
-    chr_centers = []
-    last_pos = 0
-    
-    for chrom in sorted(df['CHR'].unique()):
-        chr_df = df[df['CHR'] == chrom]
-        chr_len = chr_df['BP'].max()
-        df.loc[df['CHR'] == chrom, 'cumulative_pos'] = chr_df['BP'] + last_pos
-        chr_centers.append(last_pos + chr_len / 2)
-        last_pos += chr_len
+    # Calculate cumulative position: each chromosome starts after the previous ones' max BP
+    cumulative_pos, chr_centers = cumulative_positions(df['CHR'].to_numpy(), df['BP'].to_numpy())
+    df['cumulative_pos'] = cumulative_pos
+    chr_centers = chr_centers.tolist()
     
     # Create figure
-    fig, ax = plt.subplots(figsize=(16, 6))
+    owns_fig = ax is None
+    if owns_fig:
+        fig, ax = plt.subplots(figsize=(16, 6))
+    else:
+        fig = ax.figure
     
     # Plot by chromosome
     colors = ['#3182bd', '#9ecae1']
-    chr_list = sorted(df['CHR'].unique())
-    
-    for idx, chrom in enumerate(chr_list):
-        chr_df = df[df['CHR'] == chrom]
-        ax.scatter(chr_df['cumulative_pos'], chr_df['NEGLOG10P'], 
+    chr_arr = df['CHR'].to_numpy()
+    chr_list = np.unique(chr_arr)
+    pos_arr = df['cumulative_pos'].to_numpy()
+    nlp_arr = df['NEGLOG10P'].to_numpy()
+    
+    # Rows are sorted by CHR, so each chromosome is one contiguous slice
+    starts = np.searchsorted(chr_arr, chr_list, side='left')
+    ends = np.searchsorted(chr_arr, chr_list, side='right')
+    for idx, (start, end) in enumerate(zip(starts, ends)):
+        ax.scatter(pos_arr[start:end], nlp_arr[start:end], 
                   c=colors[idx % 2], s=5, alpha=0.7, linewidths=0)
     
     # Significance lines
@@ -117,7 +139,8 @@ def create_manhattan_plot(df, output_prefix, annotation_pval=1e-5, gw_sig=5e-8):
                label=f'Suggestive (P={annotation_pval:.0e})', alpha=0.7)
     
     # Annotate top SNPs
-    top_snps = df[df['P'] < annotation_pval].copy()
+    # Compare on float64 P: float32 NEGLOG10P misclassifies p-values exactly at the threshold
+    top_snps = df.loc[df['P'].to_numpy() < annotation_pval]
     
     if len(top_snps) > 0:
         print(f"Annotating {len(top_snps)} top SNPs...")
@@ -125,17 +148,18 @@ def create_manhattan_plot(df, output_prefix, annotation_pval=1e-5, gw_sig=5e-8):
         if len(top_snps) > 20:
             top_snps = top_snps.nsmallest(20, 'P')
         
-        for _, snp in top_snps.iterrows():
-            ax.annotate(snp['SNP'], 
-                       xy=(snp['cumulative_pos'], snp['NEGLOG10P']),
+        xs = top_snps['cumulative_pos'].to_numpy()
+        ys = top_snps['NEGLOG10P'].to_numpy()
+        ax.scatter(xs, ys, c='red', s=30, marker='D', zorder=5, edgecolors='darkred', linewidths=0.5)
+        
+        for label, x, y in zip(top_snps['SNP'].tolist(), xs.tolist(), ys.tolist()):
+            ax.annotate(label, 
+                       xy=(x, y),
                        xytext=(5, 5), textcoords='offset points',
                        fontsize=7, alpha=0.8,
                        bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', 
                                 alpha=0.3, edgecolor='none'),
                        arrowprops=dict(arrowstyle='->', lw=0.5, alpha=0.5))
-            
-            ax.scatter([snp['cumulative_pos']], [snp['NEGLOG10P']], 
-                      c='red', s=30, marker='D', zorder=5, edgecolors='darkred', linewidths=0.5)
     else:
         print("No SNPs reached annotation threshold")
     
@@ -157,43 +181,58 @@ def create_manhattan_plot(df, output_prefix, annotation_pval=1e-5, gw_sig=5e-8):
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save PNG
     output_file = f'{output_prefix}_manhattan.png'
     print(f"Saving Manhattan plot to {output_file}...")
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Manhattan plot (PNG) saved successfully")
     
-    plt.close()
+    if owns_fig:
+        plt.close(fig)
     
     return top_snps
 
-def create_qq_plot(df, output_prefix):
-    """Create QQ plot"""
+def create_qq_plot(df, output_prefix, ax=None):
+    """Create QQ plot (on ax if given, else on a new figure)"""
     
     print("Creating QQ plot...")
     
-    pvals = df['P'].dropna()
+    # Boolean indexing copies (and drops NaN), so the in-place sort leaves df untouched
+    pvals = df['P'].to_numpy(dtype=np.float64)
     pvals = pvals[pvals > 0]
     
     if len(pvals) == 0:
         print("No valid p-values for QQ plot")
         return None
     
-    observed = -np.log10(sorted(pvals))
-    n = len(observed)
-    expected = -np.log10(np.arange(1, n + 1) / (n + 1))
+    pvals.sort()
+    n = len(pvals)
+    
+    if n > QQ_MAX_POINTS:
+        head = QQ_MAX_POINTS // 2
+        idx = np.concatenate([np.arange(head),
+                              np.linspace(head, n - 1, QQ_MAX_POINTS - head).astype(np.int64)])
+    else:
+        idx = np.arange(n)
+    observed = -np.log10(pvals[idx])
+    expected = -np.log10((idx + 1) / (n + 1))
     
     # Calculate lambda (genomic inflation factor)
-    chisq_values = -2 * np.log(pvals)
+    chisq_values = np.log(pvals, out=np.empty_like(pvals))
+    chisq_values *= -2
     lambda_gc = np.median(chisq_values) / 0.456
     
-    fig, ax = plt.subplots(figsize=(7, 7))
+    owns_fig = ax is None
+    if owns_fig:
+        fig, ax = plt.subplots(figsize=(7, 7))
+    else:
+        fig = ax.figure
     
     ax.scatter(expected, observed, s=10, alpha=0.6, c='#3182bd', linewidths=0)
     
-    max_val = max(max(expected), max(observed))
+    max_val = max(expected.max(), observed.max())
     ax.plot([0, max_val], [0, max_val], 'r--', linewidth=2, alpha=0.7, label='Expected')
     
     ax.text(0.05, 0.95, f'λ = {lambda_gc:.3f}', 
@@ -207,15 +246,16 @@ def create_qq_plot(df, output_prefix):
     ax.grid(True, alpha=0.2, linestyle=':', linewidth=0.5)
     ax.legend(loc='lower right', framealpha=0.9)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save QQ plot
     output_file = f'{output_prefix}_qq.png'
     print(f"Saving QQ plot to {output_file}...")
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"QQ plot saved successfully")
     
-    plt.close()
+    if owns_fig:
+        plt.close(fig)
     
     print(f"Genomic inflation factor (λ): {lambda_gc:.4f}")
     
@@ -244,8 +284,9 @@ def main():
     df = load_gwas_results(input_file)
     
     # Calculate significance counts
-    gw_significant = df[df['P'] < gw_sig]
-    suggestive = df[df['P'] < annotation_pval]
+    pvals = df['P'].to_numpy()
+    gw_significant = df.loc[pvals < gw_sig]
+    suggestive = df.loc[pvals < annotation_pval]
     
     print("\n" + "="*60)
     print("SIGNIFICANCE SUMMARY")
@@ -273,10 +314,15 @@ def main():
     print("\n" + "="*60)
     print("GENERATING PLOTS")
     print("="*60)
-    top_snps = create_manhattan_plot(df, output_prefix, annotation_pval, gw_sig)
+    # One figure serves both plots; it is cleared and resized in between
+    fig = plt.figure(figsize=(16, 6))
+    top_snps = create_manhattan_plot(df, output_prefix, annotation_pval, gw_sig, ax=fig.add_subplot())
     
     print("\n" + "="*60)
-    lambda_gc = create_qq_plot(df, output_prefix)
+    fig.clear()
+    fig.set_size_inches(7, 7)
+    lambda_gc = create_qq_plot(df, output_prefix, ax=fig.add_subplot())
+    plt.close(fig)
     
     # Save annotated SNPs for plot
     if len(top_snps) > 0:
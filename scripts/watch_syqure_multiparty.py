@@ -7,15 +7,36 @@ Prints per-peer step status, proxy listener readiness, and hotlink rx/tx deltas.
 from __future__ import annotations
 
 import argparse
-import json
+import ctypes
+import errno
+import os
+import re
+import select
+import selectors
 import socket
+import struct
 import subprocess
 import sys
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # stdlib fallback; also accepts bytes
+    from json import loads as _json_loads
 
 STEP_ORDER = ["gen_variants", "build_master", "align_counts", "secure_aggregate"]
+# "gen_variants={gen_variants} build_master={build_master} ..." filled per peer
+_STEP_TEMPLATE = " ".join(f"{step}={{{step}}}" for step in STEP_ORDER)
+
+# `ss -ltnH` rows: State Recv-Q Send-Q Local-Address:Port Peer-Address:Port ...
+_SS_LOCAL_PORT_RE = re.compile(r"^\S+\s+\d+\s+\d+\s+\S*:(\d+)\s", re.MULTILINE)
+# /proc/net/tcp{,6} rows: "sl: local_hex:PORT rem_hex:PORT st ..." where st 0A is LISTEN
+_PROC_LISTEN_RE = re.compile(
+    rb"^\s*\d+: [0-9A-Fa-f]+:([0-9A-Fa-f]{4}) [0-9A-Fa-f]+:[0-9A-Fa-f]{4} 0A ", re.MULTILINE
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -39,7 +60,10 @@ def parse_args() -> argparse.Namespace:
         "--interval",
         type=float,
         default=2.0,
-        help="Refresh interval seconds (default: 2.0).",
+        help=(
+            "Refresh interval seconds (default: 2.0). On Linux, changes to progress, "
+            "channel or telemetry files refresh sooner."
+        ),
     )
     parser.add_argument(
         "--once",
@@ -62,77 +86,158 @@ def discover_participants(sandbox: Path) -> List[str]:
     emails: List[str] = []
     if not sandbox.exists():
         return emails
-    for child in sandbox.iterdir():
-        if not child.is_dir():
-            continue
-        name = child.name
-        if "@" not in name:
-            continue
-        if (child / "datasites" / name).exists():
-            emails.append(name)
+    with os.scandir(sandbox) as entries:
+        for entry in entries:
+            name = entry.name
+            if "@" not in name or not entry.is_dir():
+                continue
+            if os.path.exists(os.path.join(entry.path, "datasites", name)):
+                emails.append(name)
     return sorted(emails)
 
 
 def read_json(path: Path) -> Optional[dict]:
     try:
-        return json.loads(path.read_text())
+        return _json_loads(path.read_bytes())
     except Exception:
         return None
 
 
+# flow root -> (directory mtime_ns, [(session name, session dir)]).
+# Creating or removing a session-* directory bumps the flow root's mtime; log writes
+# do not, so each session's log is still re-stat'ed every tick.
+_SESSION_DIRS: Dict[str, Tuple[int, List[Tuple[str, str]]]] = {}
+
+
+def _session_dirs(flow_root: str) -> List[Tuple[str, str]]:
+    with os.scandir(flow_root) as entries:
+        return [
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.startswith("session-") and entry.is_dir()
+        ]
+
+
 def latest_session(sandbox: Path, flow: str, emails: List[str]) -> Optional[str]:
     candidates: List[Tuple[float, str]] = []
     for email in emails:
-        flow_root = sandbox / email / "datasites" / email / "shared" / "flows" / flow
-        if not flow_root.exists():
+        flow_root = os.path.join(sandbox, email, "datasites", email, "shared", "flows", flow)
+        try:
+            mtime_ns = os.stat(flow_root).st_mtime_ns
+        except OSError:
             continue
-        for session_dir in flow_root.glob("session-*"):
-            if not session_dir.is_dir():
-                continue
-            progress_log = session_dir / "_progress" / "log.jsonl"
-            ts = progress_log.stat().st_mtime if progress_log.exists() else session_dir.stat().st_mtime
-            candidates.append((ts, session_dir.name))
+        cached = _SESSION_DIRS.get(flow_root)
+        if cached is not None and cached[0] == mtime_ns:
+            sessions = cached[1]
+        else:
+            sessions = _session_dirs(flow_root)
+            _SESSION_DIRS[flow_root] = (mtime_ns, sessions)
+        for name, path in sessions:
+            try:
+                ts = os.stat(os.path.join(path, "_progress", "log.jsonl")).st_mtime
+            except OSError:
+                try:
+                    ts = os.stat(path).st_mtime
+                except OSError:
+                    continue
+            candidates.append((ts, name))
     if not candidates:
         return None
-    candidates.sort(key=lambda item: item[0], reverse=True)
-    return candidates[0][1]
-
-
-def parse_step_statuses(progress_log: Path) -> Dict[str, str]:
-    statuses: Dict[str, str] = {}
-    if not progress_log.exists():
-        return statuses
-    try:
-        lines = progress_log.read_text().splitlines()
-    except Exception:
-        return statuses
-    for line in lines[-500:]:
+    return max(candidates, key=lambda item: item[0])[1]
+
+
+def _read_tail(handle, end: int, n: int, block: int = 65536) -> bytes:
+    """Read backwards from byte offset end until the data spans the last n lines."""
+    chunks: List[bytes] = []
+    newlines = 0
+    pos = end
+    # n lines need n+1 newlines when the earliest one may be cut mid-line
+    while pos > 0 and newlines <= n:
+        step = min(block, pos)
+        pos -= step
+        handle.seek(pos)
+        chunk = handle.read(step)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+    return b"".join(reversed(chunks))
+
+
+def tail_lines(path: Path, n: int = 500, block: int = 65536) -> List[str]:
+    """Return the last n lines of a file, reading backwards from the end in blocks."""
+    with open(path, "rb") as handle:
+        data = _read_tail(handle, handle.seek(0, os.SEEK_END), n, block)
+    return data.decode("utf-8", "replace").splitlines()[-n:]
+
+
+_EVENT_TO_STATUS = {
+    "step_started": "Running",
+    "step_completed": "Completed",
+    "step_shared": "Shared",
+    "step_failed": "Failed",
+}
+
+
+def apply_progress_lines(statuses: Dict[str, str], lines: List[bytes]) -> None:
+    for line in lines:
         try:
-            entry = json.loads(line)
+            entry = _json_loads(line)
         except Exception:
             continue
         step_id = entry.get("step_id")
         event = (entry.get("event") or "").strip()
         if not step_id:
             continue
-        if event == "step_started":
-            statuses[step_id] = "Running"
-        elif event == "step_completed":
-            statuses[step_id] = "Completed"
-        elif event == "step_shared":
-            statuses[step_id] = "Shared"
-        elif event == "step_failed":
-            statuses[step_id] = "Failed"
+        status = _EVENT_TO_STATUS.get(event)
+        if status is not None:
+            statuses[step_id] = status
         elif event == "syqure_proxy_ready":
             statuses[f"{step_id}.proxy"] = "Ready"
-    return statuses
+
+
+class StepStatuses(dict):
+    """Step id -> status; steps that have not reported yet read as "-"."""
+
+    def __missing__(self, key: str) -> str:
+        return "-"
+
+
+class ProgressTailer:
+    """Follows progress logs across ticks, parsing only bytes appended since the last one."""
+
+    SEED_LINES = 500
+
+    def __init__(self) -> None:
+        # path -> (inode, offset, trailing partial line, statuses)
+        self._state: Dict[Path, Tuple[int, int, bytes, Dict[str, str]]] = {}
+
+    def statuses(self, progress_log: Path) -> Dict[str, str]:
+        try:
+            with open(progress_log, "rb") as handle:
+                st = os.fstat(handle.fileno())
+                state = self._state.get(progress_log)
+                if state is None or state[0] != st.st_ino or st.st_size < state[1]:
+                    # First sight, rotated or truncated: seed from the last lines
+                    statuses: Dict[str, str] = StepStatuses()
+                    data = _read_tail(handle, st.st_size, self.SEED_LINES)
+                    complete, _, partial = data.rpartition(b"\n")
+                    apply_progress_lines(statuses, complete.split(b"\n")[-self.SEED_LINES:])
+                else:
+                    _, offset, partial, statuses = state
+                    handle.seek(offset)
+                    complete, _, partial = (partial + handle.read(st.st_size - offset)).rpartition(b"\n")
+                    apply_progress_lines(statuses, complete.split(b"\n"))
+        except OSError:
+            self._state.pop(progress_log, None)
+            return StepStatuses()
+        self._state[progress_log] = (st.st_ino, st.st_size, partial, statuses)
+        return statuses
 
 
 def read_private_step_line(path: Path) -> str:
     if not path.exists():
         return "-"
     try:
-        lines = path.read_text().splitlines()
+        lines = tail_lines(path, 1)
     except Exception:
         return "-"
     if not lines:
@@ -140,65 +245,221 @@ def read_private_step_line(path: Path) -> str:
     return lines[-1]
 
 
-def is_listening(port: int) -> bool:
+PROBE_TIMEOUT = 0.05
+
+
+def probe_listening(ports: List[int], timeout: float = PROBE_TIMEOUT) -> Set[int]:
+    """Ports accepting loopback connections, probed together within one timeout."""
+    found: Set[int] = set()
+    sel = selectors.DefaultSelector()
+    socks: List[socket.socket] = []
+    try:
+        for port in set(ports):
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError:
+                continue
+            socks.append(sock)
+            sock.setblocking(False)
+            err = sock.connect_ex(("127.0.0.1", int(port)))
+            if err == 0:
+                found.add(port)
+            elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                sel.register(sock, selectors.EVENT_WRITE, port)
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                sel.unregister(key.fileobj)
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    found.add(key.data)
+    finally:
+        sel.close()
+        for sock in socks:
+            sock.close()
+    return found
+
+
+LISTEN_CACHE_TTL = 5.0
+# port -> (expiry, listening flag, channel dir mtime_ns when probed)
+_LISTEN_CACHE: Dict[int, Tuple[float, bool, int]] = {}
+
+
+def cached_probe_listening(channel_mtimes: Dict[int, int], now: float) -> Set[int]:
+    """probe_listening() for ports whose cached flag expired or whose channel dir changed."""
+    stale: List[int] = []
+    for port, mtime_ns in channel_mtimes.items():
+        cached = _LISTEN_CACHE.get(port)
+        if cached is None or cached[0] <= now or cached[2] != mtime_ns:
+            stale.append(port)
+    if stale:
+        found = probe_listening(stale)
+        for port in stale:
+            _LISTEN_CACHE[port] = (now + LISTEN_CACHE_TTL, port in found, channel_mtimes[port])
+    return {port for port in channel_mtimes if _LISTEN_CACHE[port][1]}
+
+
+PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+# /proc/net file -> unbuffered handle kept open and re-read from offset 0 each tick
+_PROC_NET_HANDLES: Dict[str, object] = {}
+
+
+def _proc_listening_ports() -> Optional[Set[int]]:
+    if not _PROC_NET_HANDLES:
+        for path in PROC_NET_TCP:
+            try:
+                _PROC_NET_HANDLES[path] = open(path, "rb", buffering=0)
+            except OSError:
+                continue
+        if not _PROC_NET_HANDLES:
+            return None
+    ports: Set[int] = set()
+    for handle in _PROC_NET_HANDLES.values():
+        try:
+            handle.seek(0)
+            data = handle.readall()
+        except OSError:
+            return None
+        ports.update(int(port, 16) for port in _PROC_LISTEN_RE.findall(data))
+    return ports
+
+
+def listening_ports() -> Optional[Set[int]]:
+    """All local TCP ports in LISTEN state, or None when neither /proc/net nor ss is usable."""
+    ports = _proc_listening_ports()
+    if ports is not None:
+        return ports
     try:
         proc = subprocess.run(
-            ["lsof", "-nP", f"-iTCP:{int(port)}", "-sTCP:LISTEN"],
+            ["ss", "-ltnH"],
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
             text=True,
             check=False,
         )
-        lines = [line for line in (proc.stdout or "").splitlines() if line.strip()]
-        if proc.returncode == 0 and len(lines) >= 2:
-            return True
     except FileNotFoundError:
-        pass
+        return None
+    if proc.returncode != 0:
+        return None
+    return {int(port) for port in _SS_LOCAL_PORT_RE.findall(proc.stdout)}
+
+
+# channel file path -> ((mtime_ns, size), parsed contents)
+_CHANNEL_CACHE: Dict[str, Tuple[Tuple[int, int], object]] = {}
+
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(0.08)
+def _parse_stream_tcp(data: bytes) -> object:
+    return _json_loads(data)
+
+
+def _parse_stream_accept(data: bytes) -> object:
+    return data.strip() == b"1"
+
+
+def read_channel_file(path: str, parse: Callable[[bytes], object]) -> object:
+    """Parse a small channel file, reusing the last result while its mtime and size hold."""
     try:
-        return sock.connect_ex(("127.0.0.1", int(port))) == 0
+        st = os.stat(path)
+    except OSError:
+        _CHANNEL_CACHE.pop(path, None)
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CHANNEL_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            data = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        value = parse(data)
     except Exception:
-        return False
-    finally:
-        sock.close()
+        value = None
+    _CHANNEL_CACHE[path] = (key, value)
+    return value
+
+
+@dataclass
+class ChannelState:
+    """One _mpc/<a>_to_<b> channel as seen by a single peer."""
+
+    __slots__ = ("name", "path", "port", "accept")
+    name: str
+    path: str
+    port: Optional[int]
+    accept: bool
+
+
+def local_port_for(email: str, stream_tcp: object) -> Optional[int]:
+    """This peer's port from stream.tcp: ports[email], else the shared "port"."""
+    if not isinstance(stream_tcp, dict):
+        return None
+    ports = stream_tcp.get("ports")
+    port = ports.get(email) if isinstance(ports, dict) else None
+    if port is None:
+        port = stream_tcp.get("port")
+    try:
+        return int(port) if port is not None else None
+    except Exception:
+        return None
 
 
-def parse_mpc_channels(session_root: Path, email: str) -> str:
+def read_mpc_channels(session_root: Path, email: str) -> Optional[List[ChannelState]]:
     mpc_root = session_root / "_mpc"
     if not mpc_root.exists():
+        return None
+    with os.scandir(mpc_root) as entries:
+        channels = sorted(
+            (entry for entry in entries if "_to_" in entry.name and entry.is_dir()),
+            key=lambda entry: entry.name,
+        )
+    return [
+        ChannelState(
+            entry.name,
+            entry.path,
+            local_port_for(email, read_channel_file(os.path.join(entry.path, "stream.tcp"), _parse_stream_tcp)),
+            bool(read_channel_file(os.path.join(entry.path, "stream.accept"), _parse_stream_accept)),
+        )
+        for entry in channels
+    ]
+
+
+def probe_channel_listeners(channel_lists: List[Optional[List[ChannelState]]]) -> Set[int]:
+    """Fallback when neither /proc/net nor ss is usable: one batched probe over every channel port."""
+    channel_mtimes: Dict[int, int] = {}
+    for channels in channel_lists:
+        for channel in channels or ():
+            if channel.port is None:
+                continue
+            try:
+                channel_mtimes[channel.port] = os.stat(channel.path).st_mtime_ns
+            except OSError:
+                channel_mtimes[channel.port] = 0
+    if not channel_mtimes:
+        return set()
+    return cached_probe_listening(channel_mtimes, time.monotonic())
+
+
+def format_mpc_channels(channels: Optional[List[ChannelState]], listening: Set[int]) -> str:
+    if not channels:
         return "-"
-    parts: List[str] = []
-    for channel_dir in sorted(mpc_root.iterdir()):
-        if not channel_dir.is_dir() or "_to_" not in channel_dir.name:
-            continue
-        stream_tcp = read_json(channel_dir / "stream.tcp") or {}
-        ports = stream_tcp.get("ports") if isinstance(stream_tcp.get("ports"), dict) else {}
-        local_port = ports.get(email) if isinstance(ports, dict) else None
-        if local_port is None:
-            local_port = stream_tcp.get("port")
-        try:
-            local_port = int(local_port) if local_port is not None else None
-        except Exception:
-            local_port = None
-        accept_flag = (channel_dir / "stream.accept").read_text().strip() == "1" if (channel_dir / "stream.accept").exists() else False
-        listening_flag = is_listening(local_port) if isinstance(local_port, int) else False
-        state = f"{'L' if listening_flag else 'x'}{'A' if accept_flag else '-'}"
-        parts.append(f"{channel_dir.name}:{state}:{local_port if local_port else '-'}")
-    return ", ".join(parts) if parts else "-"
+    return ", ".join(
+        f"{c.name}:{'L' if c.port in listening else 'x'}{'A' if c.accept else '-'}:{c.port or '-'}"
+        for c in channels
+    )
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def fmt_bytes(value: int) -> str:
-    units = ["B", "KB", "MB", "GB", "TB"]
-    val = float(value)
-    idx = 0
-    while val >= 1024.0 and idx < len(units) - 1:
-        val /= 1024.0
-        idx += 1
-    if idx == 0:
-        return f"{int(val)}{units[idx]}"
-    return f"{val:.1f}{units[idx]}"
+    if value < 1024:
+        return f"{value}B"
+    idx = min((value.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{value / (1 << (idx * 10)):.1f}{_BYTE_UNITS[idx]}"
 
 
 def telemetry_line(
@@ -229,57 +490,175 @@ def telemetry_line(
     return line, {"tx_bytes": tx, "rx_bytes": rx, "updated_ms": updated_ms}
 
 
+# inotify(7) event bits; see <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_IGNORED = 0x00008000
+_WATCH_MASK = IN_MODIFY | IN_CREATE | IN_MOVED_TO
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+MIN_TICK = 0.2
+
+
+def _load_inotify() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class ChangeWaiter:
+    """Sleep until a watched directory changes or the refresh interval runs out.
+
+    Uses inotify on Linux; elsewhere, or if inotify cannot be set up, this is a
+    plain time.sleep(interval).
+    """
+
+    def __init__(self) -> None:
+        self._libc = _load_inotify()
+        self._fd: Optional[int] = None
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+        # watched directory -> watch descriptor
+        self._watches: Dict[str, int] = {}
+
+    def watch(self, paths: List[Path]) -> None:
+        """Add watches for directories not already watched; missing ones are retried next call."""
+        if self._fd is None:
+            return
+        for path in paths:
+            key = str(path)
+            if key in self._watches:
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(key), _WATCH_MASK)
+            if wd >= 0:
+                self._watches[key] = wd
+
+    def _drain(self) -> None:
+        dropped: Set[int] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + _INOTIFY_EVENT.size <= len(data):
+                wd, mask, _cookie, name_len = _INOTIFY_EVENT.unpack_from(data, offset)
+                if mask & IN_IGNORED:
+                    dropped.add(wd)
+                offset += _INOTIFY_EVENT.size + name_len
+        if dropped:
+            # Watched directory was removed; let watch() re-add it if it comes back
+            self._watches = {k: wd for k, wd in self._watches.items() if wd not in dropped}
+
+    def wait(self, interval: float) -> None:
+        if self._fd is None:
+            time.sleep(interval)
+            return
+        started = time.monotonic()
+        ready, _, _ = select.select([self._fd], [], [], interval)
+        if not ready:
+            return
+        self._drain()
+        # Coalesce bursts of writes into one refresh
+        remaining = MIN_TICK - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+            self._drain()
+
+
+@dataclass(frozen=True)
+class PeerPaths:
+    """Per-participant paths that do not depend on the session; built once."""
+
+    email: str
+    role: str
+    datasite_root: Path
+    telemetry_path: Path
+    step_logs_dir: Path
+
+    @classmethod
+    def for_email(cls, sandbox: Path, email: str) -> "PeerPaths":
+        datasite_root = sandbox / email / "datasites" / email
+        return cls(
+            email=email,
+            role=role_for_email(email),
+            datasite_root=datasite_root,
+            telemetry_path=datasite_root / ".syftbox" / "hotlink_telemetry.json",
+            step_logs_dir=sandbox / email / ".biovault" / "multiparty_step_logs",
+        )
+
+
+def write_lines(lines: List[str]) -> None:
+    """Emit one tick's output with a single write and flush."""
+    if not lines:
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def snapshot(
     prefix: str,
     sandbox: Path,
     flow: str,
     emails: List[str],
+    peers: List[PeerPaths],
     prev_tel: Dict[str, dict],
+    tailer: ProgressTailer,
+    waiter: ChangeWaiter,
     emit_wait: bool,
 ) -> Tuple[Dict[str, dict], bool]:
     session = latest_session(sandbox, flow, emails)
     ts = time.strftime("%H:%M:%S")
+    out: List[str] = []
     if session or emit_wait:
-        print(f"{prefix} {ts} flow={flow} session={session or '-'}")
+        out.append(f"{prefix} {ts} flow={flow} session={session or '-'}")
     if not session:
         if emit_wait:
-            print(f"{prefix} waiting for session-* in {sandbox}")
+            out.append(f"{prefix} waiting for session-* in {sandbox}")
+        write_lines(out)
         return prev_tel, False
 
     next_tel: Dict[str, dict] = dict(prev_tel)
-    for email in emails:
-        role = role_for_email(email)
-        session_root = sandbox / email / "datasites" / email / "shared" / "flows" / flow / session
+    session_roots = [peer.datasite_root / "shared" / "flows" / flow / session for peer in peers]
+    channel_lists = [read_mpc_channels(root, peer.email) for root, peer in zip(session_roots, peers)]
+    waiter.watch(
+        [root / sub for root in session_roots for sub in ("_progress", "_mpc")]
+        + [Path(channel.path) for channels in channel_lists for channel in channels or ()]
+        + [peer.telemetry_path.parent for peer in peers]
+    )
+    listening = listening_ports()
+    if listening is None:
+        listening = probe_channel_listeners(channel_lists)
+    for peer, session_root, channels in zip(peers, session_roots, channel_lists):
+        email = peer.email
         progress_dir = session_root / "_progress"
-        statuses = parse_step_statuses(progress_dir / "log.jsonl")
-        steps = []
-        for step in STEP_ORDER:
-            value = statuses.get(step, "-")
-            if step == "secure_aggregate" and statuses.get("secure_aggregate.proxy") == "Ready":
-                value = f"{value}+proxy"
-            steps.append(f"{step}={value}")
-        channel_text = parse_mpc_channels(session_root, email)
-
-        telemetry_path = sandbox / email / "datasites" / email / ".syftbox" / "hotlink_telemetry.json"
-        telemetry = read_json(telemetry_path)
+        statuses = tailer.statuses(progress_dir / "log.jsonl")
+        steps_text = _STEP_TEMPLATE.format_map(statuses)
+        if statuses.get("secure_aggregate.proxy") == "Ready":
+            field = f"secure_aggregate={statuses['secure_aggregate']}"
+            steps_text = steps_text.replace(field, f"{field}+proxy", 1)
+        channel_text = format_mpc_channels(channels, listening)
+
+        telemetry = read_json(peer.telemetry_path)
         telem_text, telem_state = telemetry_line(telemetry, prev_tel.get(email))
         if telem_state:
             next_tel[email] = telem_state
 
-        private_log = (
-            sandbox
-            / email
-            / ".biovault"
-            / "multiparty_step_logs"
-            / session
-            / "secure_aggregate.log"
-        )
+        private_log = peer.step_logs_dir / session / "secure_aggregate.log"
         secure_tail = read_private_step_line(private_log)
-        print(
-            f"{prefix} {role:<10} {' '.join(steps)} | {telem_text} | mpc[{channel_text}]"
-        )
-        print(f"{prefix} {role:<10} secure_tail: {secure_tail}")
+        head = f"{prefix} {peer.role:<10}"
+        out.append(f"{head} {steps_text} | {telem_text} | mpc[{channel_text}]")
+        out.append(f"{head} secure_tail: {secure_tail}")
 
+    write_lines(out)
     return next_tel, True
 
 
@@ -295,7 +674,10 @@ def main() -> int:
         print(f"{args.prefix} no participants found under {sandbox}", file=sys.stderr)
         return 1
 
+    peers = [PeerPaths.for_email(sandbox, email) for email in emails]
     prev_tel: Dict[str, dict] = {}
+    tailer = ProgressTailer()
+    waiter = ChangeWaiter()
     had_session = False
     last_wait_log_at = 0.0
     while True:
@@ -308,7 +690,10 @@ def main() -> int:
             sandbox,
             args.flow,
             emails,
+            peers,
             prev_tel,
+            tailer,
+            waiter,
             emit_wait,
         )
         if emit_wait and not has_session:
@@ -316,7 +701,7 @@ def main() -> int:
         had_session = has_session
         if args.once:
             return 0
-        time.sleep(max(args.interval, 0.2))
+        waiter.wait(max(args.interval, MIN_TICK))
 
 
 if __name__ == "__main__":